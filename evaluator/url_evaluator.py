@@ -7,6 +7,20 @@ from typing import Callable, List
 logger = logging.getLogger("birdwatch")
 logger.setLevel(logging.INFO)
 
+# Compiled once at import; _extract_urls runs for every note checked.
+_URL_PATTERN = re.compile(
+  r"""
+      (?:
+          https?://               # optional scheme
+      )?
+      (?:www\.)?                  # optional www
+      [\w\-._~%]+                 # subdomain or domain name chars
+      \.[a-zA-Z]{2,}              # dot + top level domain (≥2 letters)
+      (?:/[^\s]*)?                # optional query/fragment
+      """,
+  re.VERBOSE,
+)
+
 
 def check_all_urls_for_note(note_text: str, check_url_fn: Callable[[str], bool]) -> bool:
   """
@@ -49,20 +63,7 @@ def _extract_urls(text: str) -> List[List[str]]:
   Return a List of Lists: each inner List contains multiple possible variants
   of an individual URL.
   """
-  pattern = re.compile(
-    r"""
-        (?:
-            https?://               # optional scheme
-        )?
-        (?:www\.)?                  # optional www
-        [\w\-._~%]+                 # subdomain or domain name chars
-        \.[a-zA-Z]{2,}              # dot + top level domain (≥2 letters)
-        (?:/[^\s]*)?                # optional query/fragment
-        """,
-    re.VERBOSE,
-  )
-
-  raw_matches = pattern.findall(text)
+  raw_matches = _URL_PATTERN.findall(text)
 
   # Strip common trailing punctuation that often follows URLs in note text
   # Return both variants (with and without trailing punctuation) for each URL.
@@ -14,6 +14,8 @@ import pandas as pd
 FACTOR_SPLIT_POINT = 0.15
 MIN_LINGERS = 29
 QUANTILE_THRESHOLD = 0.7
+# String forms of likeTags/dislikeTags that mean the rater selected no tags.
+EMPTY_TAG_VALUES = ("[]", "['NOT_APPLICABLE']")
 
 
 def infer_rater_factors(
@@ -49,11 +51,9 @@ def infer_rater_factors(
     factorNotes[[c.noteIdKey, "factor"]], on=c.noteIdKey
   )
   logger.info(f"{ratingsFromCbUsers.shape[0]} ratings on valid notes")
-  ratingsFromCbUsers["signCorrectedFactor"] = ratingsFromCbUsers.apply(
-    lambda row: -row["factor"]
-    if (row[c.helpfulnessLevelKey] == c.notHelpfulValueTsv)
-    else row["factor"],
-    axis=1,
+  ratingsFromCbUsers["signCorrectedFactor"] = ratingsFromCbUsers["factor"].mask(
+    ratingsFromCbUsers[c.helpfulnessLevelKey] == c.notHelpfulValueTsv,
+    -ratingsFromCbUsers["factor"],
   )
   inferredFactors = (
     ratingsFromCbUsers[[cbc.userIdKey, "signCorrectedFactor"]]
@@ -100,16 +100,12 @@ def score_posts(
     == postRatingsWFactor.shape[0]
   ), "multiple actions per user-post"
   logger.info(f"{postRatingsWFactor.shape[0]} post ratings with factor")
-  posActionsWFactor = postRatingsWFactor.loc[
-    (
-      ~(postRatingsWFactor["likeTags"].astype(str).isin(["[]", "['NOT_APPLICABLE']"]))
-      & (postRatingsWFactor["dislikeTags"].astype(str).isin(["[]", "['NOT_APPLICABLE']"]))
-    )
-  ]
+  # Stringifying the tag lists is the expensive part, so do it once per column.
+  noLikeTags = postRatingsWFactor[cbc.likeTagsKey].astype(str).isin(EMPTY_TAG_VALUES)
+  noDislikeTags = postRatingsWFactor[cbc.dislikeTagsKey].astype(str).isin(EMPTY_TAG_VALUES)
+  posActionsWFactor = postRatingsWFactor.loc[~noLikeTags & noDislikeTags]
   logger.info(f"{posActionsWFactor.shape[0]} positive rating actions")
-  negActionsWFactor = postRatingsWFactor.loc[
-    ~(postRatingsWFactor["dislikeTags"].astype(str).isin(["[]", "['NOT_APPLICABLE']"]))
-  ]
+  negActionsWFactor = postRatingsWFactor.loc[~noDislikeTags]
   logger.info(f"{negActionsWFactor.shape[0]} negative rating actions")
   actionsWFactor = (
     postActions.loc[(postActions["isAdmitted"] == True)][
@@ -230,18 +230,23 @@ class PseudoRatersRunner:
   def _create_dataset_with_extreme_rating_on_each_note(self, ratingToAddWithoutNoteId):
     ## for each rating (ided by raterParticipantId and raterIndex)
     if ratingToAddWithoutNoteId[c.helpfulNumKey] is not None:
-      ratingsWithNoteIds = []
-      for noteRow in (
+      # Build the pseudo-ratings column-wise: broadcast the pseudo-rater's fields across one row
+      # per note rather than materializing a dict per note and having pandas re-infer the schema.
+      noteIds = (
         self.ratingFeaturesAndLabels[[c.noteIdKey, mf_c.noteIndexKey]]
         .drop_duplicates()
-        .itertuples()
-      ):
-        ratingToAdd = ratingToAddWithoutNoteId.copy()
-        ratingToAdd[c.noteIdKey] = getattr(noteRow, c.noteIdKey)
-        ratingToAdd[mf_c.noteIndexKey] = getattr(noteRow, mf_c.noteIndexKey)
-        ratingsWithNoteIds.append(ratingToAdd)
-      extremeRatingsToAdd = pd.DataFrame(ratingsWithNoteIds).drop(
-        [c.internalRaterInterceptKey, c.internalRaterFactor1Key], axis=1
+        .reset_index(drop=True)
+      )
+      extremeRatingsToAdd = pd.DataFrame(
+        {
+          **{
+            key: value
+            for key, value in ratingToAddWithoutNoteId.items()
+            if key not in (c.internalRaterInterceptKey, c.internalRaterFactor1Key)
+          },
+          c.noteIdKey: noteIds[c.noteIdKey],
+          mf_c.noteIndexKey: noteIds[mf_c.noteIndexKey],
+        }
       )
       extremeRatingsToAdd[c.noteIdKey] = extremeRatingsToAdd[c.noteIdKey].astype(np.int64)
       if isinstance(self.ratingFeaturesAndLabels[c.raterParticipantIdKey].dtype, pd.Int64Dtype):
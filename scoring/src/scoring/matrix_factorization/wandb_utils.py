@@ -20,10 +20,11 @@ import getpass
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-import wandb as _wandb
 
+if TYPE_CHECKING:
+  import wandb as _wandb
 
 if sys.version_info >= (3, 8):
   from typing import Literal, TypedDict  # pylint: disable=no-name-in-module
@@ -34,6 +35,17 @@ logger = logging.getLogger("birdwatch.wandb_utils")
 logger.setLevel(logging.INFO)
 
 
+def _import_wandb():
+  """Import wandb on first use.
+
+  wandb is slow to import and only needed once W&B logging is enabled, so keep it off the import
+  path of matrix_factorization (and therefore of every scorer worker process).
+  """
+  import wandb
+
+  return wandb
+
+
 # See: https://docs.wandb.ai/ref/python/init or wandb's source code
 class WandbInitArgs(TypedDict, total=False):  # total=False makes all keys optional
   project: str
@@ -63,15 +75,12 @@ WANDB_CONFIG: WandbInitArgs = {
   "entity": os.getenv("WANDB_ENTITY", "birdwatch-service"),
   "name": os.getenv("WANDB_NAME", "full-pipeline"),
   "group": os.getenv("WANDB_GROUP", "unknown-group"),
-  "settings": _wandb.Settings(
-    _file_stream_retry_max=15,
-  ),
 }
 
 
 class WandbProxy:
   def __init__(self):
-    self._run: Optional[_wandb.wandb_run.Run] = None
+    self._run: Optional["_wandb.wandb_run.Run"] = None
 
   @property
   def _enabled(self) -> bool:
@@ -81,20 +90,23 @@ class WandbProxy:
   def _ensure_init(self) -> None:
     host = os.getenv("WANDB_HOST", "https://wandb.twitter.biz/")
     if self._run is None:
+      if not self._enabled:
+        # Logging to a disabled run is a no-op, so don't import wandb just to create one.
+        return
+      _wandb = _import_wandb()
       try:
-        if self._enabled:
-          logger.info("Logging into W&B and initializing run")
-          _wandb.login(host=host, key=self._get_wandb_key())
-          self._run = _wandb.init(**WANDB_CONFIG)
-        else:
-          logger.info("W&B is disabled")
-          self._run = _wandb.init(mode="disabled")
+        logger.info("Logging into W&B and initializing run")
+        _wandb.login(host=host, key=self._get_wandb_key())
+        self._run = _wandb.init(
+          **{"settings": _wandb.Settings(_file_stream_retry_max=15), **WANDB_CONFIG}
+        )
       except Exception as e:
         logger.error(f"W&B initialization failed: {e}")
         self._run = _wandb.init(mode="disabled")
 
   def __getattr__(self, name: str) -> Any:
     self._ensure_init()
+    _wandb = _import_wandb()
     # Special case for module-level classes like Histogram, Table, etc.
     if name in dir(_wandb) and not hasattr(self._run, name):
       return getattr(_wandb, name)
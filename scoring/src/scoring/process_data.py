@@ -73,7 +73,9 @@ def tsv_parser(
     pd.DataFrame containing parsed data
   """
   try:
-    firstLine = rawTSV.split("\n")[0]
+    # Only split off the first line: splitting the whole input would materialize a list
+    # holding every row of the (potentially multi-GB) TSV just to count header fields.
+    firstLine = rawTSV.split("\n", 1)[0]
     num_fields = len(firstLine.split("\t"))
     if num_fields != len(columns):
       raise ValueError(f"Expected {len(columns)} columns, but got {num_fields}")
@@ -358,7 +360,11 @@ def remove_duplicate_ratings(ratings: pd.DataFrame) -> pd.DataFrame:
   ratings = pd.DataFrame(ratings.drop_duplicates())
 
   numRatings = len(ratings)
-  numUniqueRaterIdNoteIdPairs = len(ratings.groupby([c.raterParticipantIdKey, c.noteIdKey]).head(1))
+  # Count unique pairs from the two key columns alone; groupby(...).head(1) would copy every
+  # column of (nearly) every rating just to take its length.  NA keys are excluded, matching
+  # groupby's default dropna behavior.
+  raterNotePairs = ratings[[c.raterParticipantIdKey, c.noteIdKey]].dropna()
+  numUniqueRaterIdNoteIdPairs = len(raterNotePairs) - int(raterNotePairs.duplicated().sum())
   assert (
     numRatings == numUniqueRaterIdNoteIdPairs
   ), f"Only {numUniqueRaterIdNoteIdPairs} unique raterId,noteId pairs but {numRatings} ratings"
@@ -1,9 +1,25 @@
+from functools import lru_cache
 import os
+import threading
 
 import dotenv
 import requests
 
 
+# One session per thread so that successive calls reuse pooled keep-alive connections to the
+# xAI API, without sharing a Session (not guaranteed thread-safe) across the worker threads
+# main.py runs under --concurrency.
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
 def _make_request(payload: dict):
     """
     Currently extremely simple and includes no retry logic.
@@ -13,7 +29,7 @@ def _make_request(payload: dict):
     "Content-Type": "application/json",
     "Authorization": f"Bearer {os.getenv('XAI_API_KEY')}",
 }
-    response = requests.post(chat_completions_url, headers=headers, json=payload)
+    response = _get_session().post(chat_completions_url, headers=headers, json=payload)
     if response.status_code != 200:
         raise Exception(f"Error making request: {response.status_code} {response.text}")
     return response.json()["choices"][0]["message"]["content"]
@@ -34,11 +50,15 @@ def get_grok_response(prompt: str, temperature: float = 0.8, model: str = "grok-
     return _make_request(payload)
 
 
+@lru_cache(maxsize=1024)
 def grok_describe_image(image_url: str, temperature: float = 0.01, model: str = "grok-2-vision-latest"):
     """
     Currently just describe image on its own. There are many possible
     improvements to consider making, e.g. passing in the post text or
     other context and describing the image and post text together.
+
+    Descriptions are cached per process: many eligible posts quote or reply to
+    the same post, so the same image URL would otherwise be described repeatedly.
     """
     payload = {
         "messages": [